@@ -13,10 +13,13 @@ from pathlib import Path
 # Add src directory to path to import fred_apis
 sys.path.append(str(Path(__file__).parent / "src"))
 
-from fred_apis import FREDDataFetcher
+# fred_apis pulls in pandas, pyarrow and the HTTP clients, so it is imported
+# inside each command to keep --help and argument errors instant
 
 def fetch_all_data():
     """Fetch all economic indicators from Bruno files"""
+    from fred_apis import FREDDataFetcher
+    
     print("Starting FRED data fetching process...")
     
     # Initialize the fetcher
@@ -26,8 +29,8 @@ def fetch_all_data():
     data = fetcher.fetch_all_indicators(
         bruno_dir="api/Economic Data",
         start_date="2020-01-01",  # Adjust date range as needed
-        format="csv",
-        delay=0.5  # Be respectful to the API
+        format="parquet",
+        max_concurrency=6  # Be respectful to the API
     )
     
     print(f"Successfully fetched data for {len(data)} indicators")
@@ -35,6 +38,8 @@ def fetch_all_data():
 
 def fetch_recent_updates():
     """Fetch only recent data updates"""
+    from fred_apis import FREDDataFetcher
+    
     print("Updating recent data...")
     
     fetcher = FREDDataFetcher(data_dir="data")
@@ -45,18 +50,19 @@ def fetch_recent_updates():
 
 def fetch_specific_indicator():
     """Example of fetching a specific economic indicator"""
-    print("Fetching GDP data...")
+    from fred_apis import FREDDataFetcher
     
-    fetcher = FREDDataFetcher(api_key="5345a9b784e816d1110d3f47c97cdfd3", data_dir="data")
-    
-    # Fetch GDP data
-    gdp_data = fetcher.fetch_series_data("GDP", start_date="2010-01-01")
+    print("Fetching GDP data...")
     
-    if gdp_data is not None:
-        print(f"Fetched {len(gdp_data)} GDP observations")
-        fetcher.save_data(gdp_data, "gdp_example", "json")
-    else:
-        print("Failed to fetch GDP data")
+    with FREDDataFetcher(api_key="5345a9b784e816d1110d3f47c97cdfd3", data_dir="data") as fetcher:
+        # Fetch GDP data
+        gdp_data = fetcher.fetch_series_data("GDP", start_date="2010-01-01")
+        
+        if gdp_data is not None:
+            print(f"Fetched {len(gdp_data)} GDP observations")
+            fetcher.save_data(gdp_data, "gdp_example", "json")
+        else:
+            print("Failed to fetch GDP data")
 
 if __name__ == "__main__":
     import argparse
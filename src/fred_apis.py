@@ -8,37 +8,175 @@ based on the Bruno API configuration files and stores the data in the data folde
 import os
 import json
 import csv
+import pickle
+import asyncio
+import aiohttp
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import re
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Single-pass pattern extracting configuration from Bruno files; group names
+# match the config keys. Name and URL are captured in lookaheads so the API key
+# and series ID embedded in the URL are still scanned.
+_RE_BRUNO = re.compile(
+    r'name:\s*(?=(?P<name>.+))'
+    r'|url:\s*(?=(?P<url>.+))'
+    r'|api_key[=:](?P<api_key>[^&\s]+)'
+    r'|series_id[=:](?P<series_id>[^&\s]+)'
+)
+
+# Characters replaced when turning indicator names into filenames
+_RE_SANITIZE = re.compile(r'[^\w\-_]')
+
+# FRED allows 120 requests per minute per API key
+_FRED_REQUESTS_PER_SECOND = 120 / 60
+
+# Number of times a series is retried after a retryable status before giving up
+_MAX_RETRIES = 5
+
+# Responses retried by both the sync and async clients: throttling and transient server errors
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode values orjson cannot handle natively when saving JSON
+    
+    Args:
+        obj: Value to encode
+        
+    Returns:
+        ISO string for timestamps, or None for missing values
+    """
+    # Check NaT first: it has an isoformat() that returns 'NaT'
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class _RateLimiter:
+    """
+    Token bucket pacing request starts, with an adaptive (AIMD) refill rate
+    
+    The refill rate is halved whenever the server throttles a request and is
+    raised back towards its ceiling with every successful request.
+    """
+    
+    def __init__(self, refill_rate: float = _FRED_REQUESTS_PER_SECOND, capacity: float = 10):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            refill_rate: Maximum number of tokens added per second
+            capacity: Maximum number of tokens that can accumulate (burst size)
+        """
+        self.max_rate = refill_rate
+        self.min_rate = refill_rate / 4
+        self.refill_rate = refill_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._last_decrease = float('-inf')
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+    
+    async def acquire(self):
+        """
+        Wait until a token is available and consume it
+        """
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= 1
+    
+    def record_success(self):
+        """
+        Record a successful request, raising the rate back towards its ceiling
+        """
+        if self.refill_rate < self.max_rate:
+            self._refill()
+            self.refill_rate = min(self.max_rate, self.refill_rate + self.max_rate / 4)
+    
+    def record_throttle(self):
+        """
+        Record an HTTP 429 response by halving the rate
+        
+        The bucket is left alone: the caller already waits for Retry-After, so
+        draining it would add a second delay on top.
+        """
+        # Concurrent requests throttled together count as a single event
+        now = time.monotonic()
+        if now - self._last_decrease >= 1 / self.refill_rate:
+            self._refill()
+            self.refill_rate = max(self.min_rate, self.refill_rate / 2)
+            self._last_decrease = now
+
+
 class FREDDataFetcher:
     """
     Fetches economic data from FRED API based on Bruno configuration files
     """
     
-    def __init__(self, api_key: Optional[str] = None, data_dir: str = "data"):
+    def __init__(self, api_key: Optional[str] = None, data_dir: str = "data",
+                 revision_window_days: int = 365):
         """
         Initialize the FRED data fetcher
         
         Args:
             api_key: FRED API key (if None, will extract from Bruno files)
             data_dir: Directory to save the fetched data
+            revision_window_days: How far back from the newest cached observation
+                to re-fetch on incremental updates, so FRED revisions are picked up
         """
         self.api_key = api_key
+        self.revision_window = timedelta(days=revision_window_days)
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.data_dir / ".cache"
+        self.cache_dir.mkdir(exist_ok=True)
         self.base_url = "https://api.stlouisfed.org/fred/series/observations"
         
+        # FRED JSON payloads are highly repetitive, so always ask for a compressed body
+        self.headers = {'Accept-Encoding': 'gzip, deflate'}
+        
+        # Pooled keep-alive session so back-to-back requests reuse the TLS connection
+        self._session = requests.Session()
+        retry = Retry(
+            total=_MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=["GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+        self._session.mount("https://", adapter)
+        
+        # In-memory results keyed by (series_id, start_date, end_date)
+        self._series_cache: Dict[Tuple[str, str, str], pd.DataFrame] = {}
+        
         # Series ID mappings for correct indicators
         self.series_mappings = {
             "CPI data": ["CPIAUCSL", "CPALTT01USM657N"],  # Consumer Price Index
@@ -59,6 +197,18 @@ class FREDDataFetcher:
             "Currency Conversions data": ["DEXUSEU", "DEXJPUS", "DEXUSUK"]  # USD exchange rates
         }
     
+    def __enter__(self) -> "FREDDataFetcher":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections
+        """
+        self._session.close()
+    
     def parse_bruno_file(self, file_path: str) -> Dict[str, Any]:
         """
         Parse a Bruno API file to extract configuration
@@ -69,6 +219,19 @@ class FREDDataFetcher:
         Returns:
             Dictionary containing API configuration
         """
+        config, _ = self._parse_bruno_file(file_path)
+        return config
+    
+    def _parse_bruno_file(self, file_path: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Parse a Bruno API file, reporting whether parsing succeeded
+        
+        Args:
+            file_path: Path to the Bruno file
+            
+        Returns:
+            Tuple of the configuration (empty on failure) and a success flag
+        """
         config = {
             'name': '',
             'url': '',
@@ -78,35 +241,23 @@ class FREDDataFetcher:
         }
         
         try:
-            with open(file_path, 'r') as file:
-                content = file.read()
-                
-            # Extract name
-            name_match = re.search(r'name:\s*(.+)', content)
-            if name_match:
-                config['name'] = name_match.group(1).strip()
-            
-            # Extract URL
-            url_match = re.search(r'url:\s*(.+)', content)
-            if url_match:
-                config['url'] = url_match.group(1).strip()
-            
-            # Extract API key from URL or params
-            api_key_match = re.search(r'api_key[=:]([^&\s]+)', content)
-            if api_key_match:
-                config['api_key'] = api_key_match.group(1).strip()
-                if not self.api_key:
-                    self.api_key = config['api_key']
-            
-            # Extract series ID
-            series_match = re.search(r'series_id[=:]([^&\s]+)', content)
-            if series_match:
-                config['series_id'] = series_match.group(1).strip()
+            content = Path(file_path).read_text()
+            
+            # Keep the first occurrence of each field
+            for match in _RE_BRUNO.finditer(content):
+                field = match.lastgroup
+                if not config[field]:
+                    config[field] = match.group(field).strip()
+            
+            # API key may come from the URL or params
+            if config['api_key'] and not self.api_key:
+                self.api_key = config['api_key']
                 
         except Exception as e:
             logger.error(f"Error parsing Bruno file {file_path}: {e}")
+            return config, False
             
-        return config
+        return config, True
     
     def get_corrected_series_ids(self, indicator_name: str) -> List[str]:
         """
@@ -120,10 +271,10 @@ class FREDDataFetcher:
         """
         return self.series_mappings.get(indicator_name, [])
     
-    def fetch_series_data(self, series_id: str, start_date: str = "1990-01-01", 
-                         end_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+    def _build_params(self, series_id: str, start_date: str,
+                      end_date: Optional[str] = None) -> Dict[str, Any]:
         """
-        Fetch data for a specific FRED series
+        Build the query parameters for a FRED observations request
         
         Args:
             series_id: FRED series identifier
@@ -131,57 +282,565 @@ class FREDDataFetcher:
             end_date: End date for data (YYYY-MM-DD format, defaults to today)
             
         Returns:
-            DataFrame with the series data or None if failed
+            Dictionary of query parameters
         """
         if not end_date:
             end_date = datetime.now().strftime("%Y-%m-%d")
             
-        params = {
+        return {
             'series_id': series_id,
             'api_key': self.api_key,
             'file_type': 'json',
             'observation_start': start_date,
             'observation_end': end_date
         }
+    
+    def _parse_observations(self, content: bytes, series_id: str,
+                            warn_empty: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Convert a raw FRED observations payload into a clean DataFrame
+        
+        Args:
+            content: Raw JSON response body from FRED
+            series_id: FRED series identifier
+            warn_empty: Whether to log a warning when there are no observations
+            
+        Returns:
+            DataFrame with the series data or None if there are no observations
+        """
+        columns = self._load_observations(content)
+        
+        if columns is None:
+            logger.warning(f"No observations found for series {series_id}")
+            return None
+        
+        dates, values = columns
+        
+        if not len(dates):
+            if warn_empty:
+                logger.warning(f"Empty dataset for series {series_id}")
+            return None
+        
+        # Remove missing values and sort by date
+        mask = ~np.isnan(values)
+        dates, values = dates[mask], values[mask]
+        order = np.argsort(dates, kind='stable')
         
+        # Keep the columns Arrow-backed so they round-trip to parquet without conversion
+        df = pa.table({
+            'date': dates[order],
+            'value': values[order],
+            'series_id': pa.array([series_id] * len(order), type=pa.string())
+        }).to_pandas(types_mapper=pd.ArrowDtype)
+        
+        # Add metadata
+        df.attrs['fetched_at'] = datetime.now().isoformat()
+        
+        logger.info(f"Successfully fetched {len(df)} observations for {series_id}")
+        return df
+    
+    def _load_observations(self, content: bytes) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Decode a FRED observations payload into date and value columns
+        
+        Args:
+            content: Raw JSON response body from FRED
+            
+        Returns:
+            Tuple of date and value arrays or None if the payload has no observations
+        """
+        data = orjson.loads(content)
+        
+        if 'observations' not in data:
+            return None
+        
+        observations = data['observations']
+        
+        # Build columns directly; FRED encodes missing values as '.'
+        dates = np.array([obs['date'] for obs in observations], dtype='datetime64[D]')
+        values = np.fromiter(
+            (float(obs['value']) if obs['value'] != '.' else np.nan for obs in observations),
+            dtype=np.float64,
+            count=len(observations)
+        )
+        return dates, values
+    
+    def _load_bruno_configs(self, bruno_files: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Parse Bruno files, reusing cached configs for files that have not changed
+        
+        Args:
+            bruno_files: Bruno files to parse
+            
+        Returns:
+            List of configurations aligned with bruno_files
+        """
+        cache_path = self.cache_dir / "bruno_configs.pkl"
+        cache = {}
+        if cache_path.exists():
+            try:
+                cache = pickle.loads(cache_path.read_bytes())
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable Bruno config cache {cache_path}: {e}")
+        
+        keys = [(str(bruno_file), self._bruno_mtime(bruno_file)) for bruno_file in bruno_files]
+        configs = {key: cache[key] for key in keys if key in cache}
+        stale = [(key, bruno_file) for key, bruno_file in zip(keys, bruno_files) if key not in cache]
+        
+        if stale:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                parsed = pool.map(self._parse_bruno_file, [str(bruno_file) for _, bruno_file in stale])
+                for (key, _), (config, ok) in zip(stale, parsed):
+                    configs[key] = config
+                    # Failed parses are retried on the next run instead of being cached
+                    if ok and key[1] is not None:
+                        cache[key] = config
+            
+            # Drop entries superseded by a newer mtime; other directories' entries are kept
+            current = dict(keys)
+            cache = {key: config for key, config in cache.items()
+                     if current.get(key[0], key[1]) == key[1]}
+            
+            try:
+                cache_path.write_bytes(pickle.dumps(cache))
+            except Exception as e:
+                logger.warning(f"Could not write Bruno config cache {cache_path}: {e}")
+        
+        configs = [configs[key] for key in keys]
+        
+        # Cached configs skip parse_bruno_file, so pick up the API key here too
+        if not self.api_key:
+            self.api_key = next((config['api_key'] for config in configs if config['api_key']), None)
+        
+        return configs
+    
+    @staticmethod
+    def _bruno_mtime(bruno_file: Path) -> Optional[int]:
+        """
+        Get a Bruno file's modification time for the config cache key
+        
+        Args:
+            bruno_file: Bruno file to check
+            
+        Returns:
+            Modification time in nanoseconds or None if the file cannot be stat'ed
+        """
         try:
-            logger.info(f"Fetching data for series: {series_id}")
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
+            return bruno_file.stat().st_mtime_ns
+        except OSError:
+            # Parsing will fail and log the error; the result is just not cached
+            return None
+    
+    def _series_cache_path(self, series_id: str) -> Path:
+        """
+        Get the on-disk cache file for a series
+        
+        Args:
+            series_id: FRED series identifier
             
-            data = response.json()
+        Returns:
+            Path to the parquet cache file
+        """
+        return self.cache_dir / f"{series_id}.parquet"
+    
+    def _load_cached_series(self, series_id: str, start_date: str, end_date: str
+                            ) -> Tuple[Optional[pd.DataFrame], Optional[Tuple[str, str]]]:
+        """
+        Load cached observations for a series and work out what is left to fetch
+        
+        The cache holds one contiguous range per series, starting at the earliest
+        date it was fetched from (kept in its 'cache_start' attr). Requests
+        starting on or after that date are served from it, only fetching newer
+        observations; earlier starts extend it backwards.
+        
+        Args:
+            series_id: FRED series identifier
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format)
             
-            if 'observations' not in data:
-                logger.warning(f"No observations found for series {series_id}")
-                return None
+        Returns:
+            Tuple of the whole cached series (or None) and the start and end dates
+            of the range to fetch (or None if the cache covers the request).
+            Forward fetches reach back over the revision window so revised
+            observations replace their cached values.
+        """
+        cache_path = self._series_cache_path(series_id)
+        if not cache_path.exists():
+            return None, (start_date, end_date)
+        
+        try:
+            cached = pd.read_parquet(cache_path, dtype_backend='pyarrow')
+            if cached.empty:
+                return None, (start_date, end_date)
             
-            # Convert to DataFrame
-            observations = data['observations']
-            df = pd.DataFrame(observations)
+            cache_start = datetime.strptime(cached.attrs['cache_start'], "%Y-%m-%d").date()
+            start = datetime.strptime(start_date, "%Y-%m-%d").date()
+            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+            cached_max = cached['date'].max()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache for series {series_id}: {e}")
+            return None, (start_date, end_date)
+        
+        if start < cache_start:
+            # Fetch up to at least the cached range so the cache stays contiguous
+            return cached, (start_date, max(end, cache_start).strftime("%Y-%m-%d"))
+        
+        if cached_max >= end:
+            return cached, None
+        
+        fetch_start = max(cache_start, cached_max - self.revision_window)
+        return cached, (fetch_start.strftime("%Y-%m-%d"), end_date)
+    
+    def _update_cached_series(self, series_id: str, cached: Optional[pd.DataFrame],
+                              fresh: Optional[pd.DataFrame],
+                              fetch_range: Tuple[str, str]) -> Optional[pd.DataFrame]:
+        """
+        Merge newly fetched observations into the cached series and persist it
+        
+        Args:
+            series_id: FRED series identifier
+            cached: Previously cached observations, if any
+            fresh: Newly fetched observations, if any
+            fetch_range: Start and end of the fetched range; cached rows within it are replaced
             
-            if df.empty:
-                logger.warning(f"Empty dataset for series {series_id}")
-                return None
+        Returns:
+            DataFrame with the whole cached series or None if nothing is available
+        """
+        if fresh is None or fresh.empty:
+            return cached if cached is not None else fresh
+        
+        fetch_start, fetch_end = (datetime.strptime(date, "%Y-%m-%d").date() for date in fetch_range)
+        
+        if cached is None:
+            df = fresh
+            cache_start = fetch_start
+        else:
+            kept = cached[(cached['date'] < fetch_start) | (cached['date'] > fetch_end)]
+            df = pd.concat([kept, fresh]).sort_values('date', ignore_index=True)
+            cache_start = min(fetch_start,
+                              datetime.strptime(cached.attrs['cache_start'], "%Y-%m-%d").date())
+        df.attrs = {**fresh.attrs, 'cache_start': cache_start.strftime("%Y-%m-%d")}
+        
+        try:
+            df.to_parquet(self._series_cache_path(series_id), index=False,
+                          compression='zstd', compression_level=3)
+        except Exception as e:
+            logger.warning(f"Could not cache series {series_id}: {e}")
+        
+        return df
+    
+    @staticmethod
+    def _slice_series(df: Optional[pd.DataFrame], start_date: str,
+                      end_date: str) -> Optional[pd.DataFrame]:
+        """
+        Cut a cached series down to the requested date range
+        
+        Args:
+            df: Whole cached series, if any
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format)
+            
+        Returns:
+            DataFrame with the observations in range or None if df is None
+        """
+        if df is None:
+            return None
+        
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        sliced = df[(df['date'] >= start) & (df['date'] <= end)].reset_index(drop=True)
+        sliced.attrs.pop('cache_start', None)
+        return sliced
+    
+    def _process_response(self, content: bytes, series_id: str, start_date: str,
+                          end_date: str, cached: Optional[pd.DataFrame],
+                          fetch_range: Tuple[str, str]) -> Optional[pd.DataFrame]:
+        """
+        Parse a FRED response and merge it into the cached series
+        
+        Args:
+            content: Raw JSON response body from FRED
+            series_id: FRED series identifier
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format)
+            cached: Previously cached observations, if any
+            fetch_range: Start and end of the range the response covers (YYYY-MM-DD format)
             
-            # Clean and format data
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
-            df = df.dropna(subset=['value'])  # Remove missing values
-            df = df.sort_values('date')
+        Returns:
+            DataFrame with the series data or None if nothing is available
+        """
+        # An incremental fetch with no new observations is expected
+        df = self._parse_observations(content, series_id, warn_empty=cached is None)
+        df = self._update_cached_series(series_id, cached, df, fetch_range)
+        return self._slice_series(df, start_date, end_date)
+    
+    def fetch_series_data(self, series_id: str, start_date: str = "1990-01-01", 
+                         end_date: Optional[str] = None,
+                         refresh: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Fetch data for a specific FRED series
+        
+        Args:
+            series_id: FRED series identifier
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format, defaults to today)
+            refresh: Ignore cached data and re-fetch the whole range
+            
+        Returns:
+            DataFrame with the series data or None if failed
+        """
+        key = self._memo_key(series_id, start_date, end_date)
+        df = self._memo_lookup(key, refresh)
+        if df is None:
+            df, current = self._fetch_series(*key, refresh)
+            # A stale fallback after a failed request is retried next time
+            if current:
+                self._memoize(key, df)
+        
+        # Hand out copies so callers cannot mutate the memoized frame
+        return df.copy() if df is not None else None
+    
+    @staticmethod
+    def _memo_key(series_id: str, start_date: str,
+                  end_date: Optional[str]) -> Tuple[str, str, str]:
+        """
+        Build the in-memory memo key for a series request
+        
+        Args:
+            series_id: FRED series identifier
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format, defaults to today)
+            
+        Returns:
+            Tuple of the series ID, start date and resolved end date
+        """
+        return series_id, start_date, end_date or datetime.now().strftime("%Y-%m-%d")
+    
+    def _memo_lookup(self, key: Tuple[str, str, str], refresh: bool) -> Optional[pd.DataFrame]:
+        """
+        Get a memoized series frame, which must not be mutated
+        
+        Args:
+            key: Memo key from _memo_key
+            refresh: Skip the memo so the series is re-fetched
+            
+        Returns:
+            Memoized DataFrame or None if the series still has to be fetched
+        """
+        return None if refresh else self._series_cache.get(key)
+    
+    def _memoize(self, key: Tuple[str, str, str], df: Optional[pd.DataFrame]):
+        """
+        Remember a fetched series frame for later requests
+        
+        Args:
+            key: Memo key from _memo_key
+            df: Fetched DataFrame; None is not memoized
+        """
+        if df is not None:
+            self._series_cache[key] = df
+    
+    def _cached_series(self, series_id: str, start_date: str, end_date: str,
+                       refresh: bool) -> Tuple[Optional[pd.DataFrame], Optional[Tuple[str, str]]]:
+        """
+        Look up the disk cache for a series request, unless it is being refreshed
+        
+        Args:
+            series_id: FRED series identifier
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format)
+            refresh: Ignore cached data and re-fetch the whole range
+            
+        Returns:
+            Tuple as returned by _load_cached_series
+        """
+        if refresh:
+            return None, (start_date, end_date)
+        
+        cached, fetch_range = self._load_cached_series(series_id, start_date, end_date)
+        if fetch_range is None:
+            logger.info(f"Using cached data for series: {series_id}")
+        return cached, fetch_range
+    
+    def _fetch_series(self, series_id: str, start_date: str, end_date: str,
+                      refresh: bool = False) -> Tuple[Optional[pd.DataFrame], bool]:
+        """
+        Fetch a FRED series, only requesting observations missing from the disk cache
+        
+        Args:
+            series_id: FRED series identifier
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format)
+            refresh: Ignore cached data and re-fetch the whole range
             
-            # Add metadata
-            df['series_id'] = series_id
-            df['fetched_at'] = datetime.now()
+        Returns:
+            Tuple of the DataFrame with the series data (or None if failed) and
+            whether it is current rather than a cached fallback after a failed request
+        """
+        cached, fetch_range = self._cached_series(series_id, start_date, end_date, refresh)
+        if fetch_range is None:
+            return self._slice_series(cached, start_date, end_date), True
+        
+        params = self._build_params(series_id, *fetch_range)
+        
+        try:
+            logger.info(f"Fetching data for series: {series_id}")
+            response = self._session.get(self.base_url, params=params, headers=self.headers)
+            response.raise_for_status()
+            logger.debug(f"Response encoding for {series_id}: "
+                         f"{response.headers.get('Content-Encoding', 'identity')}")
             
-            logger.info(f"Successfully fetched {len(df)} observations for {series_id}")
-            return df
+            df = self._process_response(response.content, series_id, start_date, end_date,
+                                        cached, fetch_range)
+            return df, True
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching data for series {series_id}: {e}")
-            return None
+            return self._slice_series(cached, start_date, end_date), False
         except Exception as e:
             logger.error(f"Unexpected error processing series {series_id}: {e}")
-            return None
+            return self._slice_series(cached, start_date, end_date), False
+    
+    async def fetch_series_data_async(self, session: aiohttp.ClientSession, series_id: str,
+                                      start_date: str = "1990-01-01",
+                                      end_date: Optional[str] = None,
+                                      semaphore: Optional[asyncio.Semaphore] = None,
+                                      executor: Optional[ThreadPoolExecutor] = None,
+                                      rate_limiter: Optional[_RateLimiter] = None,
+                                      refresh: bool = False) -> Tuple[Optional[pd.DataFrame], bool]:
+        """
+        Fetch data for a specific FRED series without blocking the event loop
+        
+        Args:
+            session: Shared aiohttp session used for the request
+            series_id: FRED series identifier
+            start_date: Start date for data (YYYY-MM-DD format)
+            end_date: End date for data (YYYY-MM-DD format, defaults to today)
+            semaphore: Optional semaphore capping the number of in-flight requests
+            executor: Optional executor used to parse responses (defaults to the loop's)
+            rate_limiter: Optional rate limiter shared by concurrent requests
+            refresh: Ignore cached data and re-fetch the whole range
+            
+        Returns:
+            DataFrame with the series data or None if failed
+        """
+        key = self._memo_key(series_id, start_date, end_date)
+        df = self._memo_lookup(key, refresh)
+        if df is None:
+            df, current = await self._fetch_series_async(session, *key, semaphore, executor,
+                                                         rate_limiter, refresh)
+            # A stale fallback after a failed request is retried next time
+            if current:
+                self._memoize(key, df)
+        
+        # Hand out copies so callers cannot mutate the memoized frame
+        return df.copy() if df is not None else None
+    
+    async def _fetch_series_async(self, session: aiohttp.ClientSession, series_id: str,
+                                  start_date: str, end_date: str,
+                                  semaphore: Optional[asyncio.Semaphore] = None,
+                                  executor: Optional[ThreadPoolExecutor] = None,
+                                  rate_limiter: Optional[_RateLimiter] = None,
+                                  refresh: bool = False) -> Tuple[Optional[pd.DataFrame], bool]:
+        """
+        Asynchronously fetch a FRED series, only requesting observations missing
+        from the disk cache
+        
+        Arguments are as for fetch_series_data_async, with end_date resolved.
+        
+        Returns:
+            Tuple of the DataFrame with the series data (or None if failed) and
+            whether it is current rather than a cached fallback after a failed request
+        """
+        # Reading the cached parquet blocks, so keep it off the event loop too
+        loop = asyncio.get_running_loop()
+        cached, fetch_range = await loop.run_in_executor(
+            executor, self._cached_series, series_id, start_date, end_date, refresh)
+        if fetch_range is None:
+            return self._slice_series(cached, start_date, end_date), True
+        
+        params = self._build_params(series_id, *fetch_range)
+        semaphore = semaphore or asyncio.Semaphore(1)
+        rate_limiter = rate_limiter or _RateLimiter()
+        
+        try:
+            for attempt in range(_MAX_RETRIES + 1):
+                async with semaphore:
+                    await rate_limiter.acquire()
+                    logger.info(f"Fetching data for series: {series_id}")
+                    async with session.get(self.base_url, params=params,
+                                           headers=self.headers) as response:
+                        status = response.status
+                        if status in _RETRY_STATUSES:
+                            retry_after = self._retry_after(response.headers.get('Retry-After'), attempt)
+                        else:
+                            response.raise_for_status()
+                            logger.debug(f"Response encoding for {series_id}: "
+                                         f"{response.headers.get('Content-Encoding', 'identity')}")
+                            content = await response.read()
+                            rate_limiter.record_success()
+                            break
+                
+                # Back off outside the semaphore so other series can keep going,
+                # unless no retry will follow
+                if attempt < _MAX_RETRIES:
+                    # Only throttling says anything about the request rate
+                    if status == 429:
+                        rate_limiter.record_throttle()
+                        logger.warning(f"Rate limited fetching {series_id}, "
+                                       f"retrying in {retry_after:.1f}s")
+                    else:
+                        logger.warning(f"Server error {status} fetching {series_id}, "
+                                       f"retrying in {retry_after:.1f}s")
+                    await asyncio.sleep(retry_after)
+            else:
+                logger.error(f"Giving up on series {series_id} after {_MAX_RETRIES + 1} "
+                             f"attempts (last status {status})")
+                return self._slice_series(cached, start_date, end_date), False
+            
+            # Parse and cache off the event loop so other responses keep arriving meanwhile
+            df = await loop.run_in_executor(
+                executor, self._process_response, content, series_id, start_date, end_date,
+                cached, fetch_range)
+            return df, True
+            
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching data for series {series_id}: {e}")
+            return self._slice_series(cached, start_date, end_date), False
+        except Exception as e:
+            logger.error(f"Unexpected error processing series {series_id}: {e}")
+            return self._slice_series(cached, start_date, end_date), False
+    
+    @staticmethod
+    def _retry_after(header: Optional[str], attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a throttled or failed request
+        
+        Args:
+            header: Value of the Retry-After header, if any
+            attempt: Zero-based number of the failed attempt
+            
+        Returns:
+            Delay in seconds
+        """
+        try:
+            return max(0.0, float(header))
+        except (TypeError, ValueError):
+            return float(2 ** attempt)
+    
+    @staticmethod
+    def _latest_fetched_at(frames) -> Optional[str]:
+        """
+        Get the most recent fetch timestamp recorded on a group of DataFrames
+        
+        Args:
+            frames: DataFrames carrying 'fetched_at' in their attrs
+            
+        Returns:
+            Latest ISO timestamp or None if none of the frames have one
+        """
+        return max((df.attrs['fetched_at'] for df in frames if 'fetched_at' in df.attrs),
+                   default=None)
     
     def save_data(self, data: pd.DataFrame, filename: str, format: str = "csv"):
         """
@@ -196,13 +855,26 @@ class FREDDataFetcher:
         
         try:
             if format == "csv":
-                data.to_csv(file_path, index=False)
+                pa_csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), file_path)
             elif format == "json":
-                data.to_json(file_path, orient='records', date_format='iso', indent=2)
+                # Arrow-backed dates come out as datetime.date; pd.Timestamp and
+                # missing values go through _json_default
+                file_path.write_bytes(orjson.dumps(
+                    data.to_dict(orient='records'),
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2,
+                    default=_json_default
+                ))
             elif format == "parquet":
-                data.to_parquet(file_path, index=False)
+                data.to_parquet(file_path, index=False, compression='zstd',
+                                compression_level=3, use_dictionary=True)
             else:
                 raise ValueError(f"Unsupported format: {format}")
+            
+            # Metadata such as fetched_at lives in attrs rather than as columns;
+            # parquet stores attrs itself, other formats get a sidecar file
+            if data.attrs and format != "parquet":
+                meta_path = self.data_dir / f"{filename}.meta.json"
+                meta_path.write_bytes(orjson.dumps(data.attrs, option=orjson.OPT_INDENT_2))
                 
             logger.info(f"Data saved to {file_path}")
             
@@ -211,8 +883,10 @@ class FREDDataFetcher:
     
     def fetch_all_indicators(self, bruno_dir: str = "api/Economic Data", 
                            start_date: str = "1990-01-01", 
-                           format: str = "csv",
-                           delay: float = 0.5) -> Dict[str, pd.DataFrame]:
+                           format: str = "parquet",
+                           delay: Optional[float] = None,
+                           max_concurrency: int = 6,
+                           refresh: bool = False) -> Dict[str, pd.DataFrame]:
         """
         Fetch data for all economic indicators from Bruno files
         
@@ -220,7 +894,39 @@ class FREDDataFetcher:
             bruno_dir: Directory containing Bruno files
             start_date: Start date for data fetching
             format: Output format for saved files
-            delay: Delay between API calls (seconds)
+            delay: Deprecated and ignored; requests are paced by a rate limiter
+            max_concurrency: Maximum number of concurrent API requests
+            refresh: Ignore cached series data and re-fetch the whole range
+            
+        Returns:
+            Dictionary mapping indicator names to DataFrames
+        """
+        if delay is not None:
+            logger.warning("The 'delay' argument is deprecated and ignored; "
+                           "use 'max_concurrency' to limit request concurrency")
+        
+        return asyncio.run(self.fetch_all_indicators_async(
+            bruno_dir=bruno_dir,
+            start_date=start_date,
+            format=format,
+            max_concurrency=max_concurrency,
+            refresh=refresh
+        ))
+    
+    async def fetch_all_indicators_async(self, bruno_dir: str = "api/Economic Data", 
+                                         start_date: str = "1990-01-01", 
+                                         format: str = "parquet",
+                                         max_concurrency: int = 6,
+                                         refresh: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch data for all economic indicators from Bruno files concurrently
+        
+        Args:
+            bruno_dir: Directory containing Bruno files
+            start_date: Start date for data fetching
+            format: Output format for saved files
+            max_concurrency: Maximum number of concurrent API requests
+            refresh: Ignore cached series data and re-fetch the whole range
             
         Returns:
             Dictionary mapping indicator names to DataFrames
@@ -231,15 +937,19 @@ class FREDDataFetcher:
             return {}
         
         all_data = {}
-        bruno_files = list(bruno_path.glob("*.bru"))
+        bruno_files = [Path(entry.path) for entry in os.scandir(bruno_path)
+                       if entry.name.endswith(".bru") and entry.is_file()]
         
         logger.info(f"Found {len(bruno_files)} Bruno files to process")
         
-        for bruno_file in bruno_files:
+        # Parse all Bruno files up front so the API key picked up from them is
+        # available before any request is issued
+        configs = self._load_bruno_configs(bruno_files)
+        
+        indicator_series = {}
+        for bruno_file, config in zip(bruno_files, configs):
             logger.info(f"Processing {bruno_file.name}")
             
-            # Parse Bruno file
-            config = self.parse_bruno_file(str(bruno_file))
             indicator_name = config['name'] or bruno_file.stem
             
             # Get correct series IDs for this indicator
@@ -253,27 +963,52 @@ class FREDDataFetcher:
                     logger.warning(f"No series ID found for {indicator_name}")
                     continue
             
-            # Fetch data for each series ID
-            indicator_data = []
-            for series_id in series_ids:
-                df = self.fetch_series_data(series_id, start_date)
-                if df is not None:
-                    indicator_data.append(df)
+            indicator_series[indicator_name] = series_ids
+        
+        # Fetch data for all series concurrently, capping in-flight requests and
+        # pacing request starts to stay under the FRED rate limit. Responses are
+        # parsed on a small thread pool while further requests are in flight
+        semaphore = asyncio.Semaphore(max_concurrency)
+        rate_limiter = _RateLimiter()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            async with aiohttp.ClientSession() as session:
+                # One task per distinct series, shared by every indicator that uses it
+                series_tasks = {}
+                for series_ids in indicator_series.values():
+                    for series_id in series_ids:
+                        if series_id not in series_tasks:
+                            series_tasks[series_id] = asyncio.create_task(
+                                self.fetch_series_data_async(
+                                    session, series_id, start_date,
+                                    semaphore=semaphore, executor=executor,
+                                    rate_limiter=rate_limiter, refresh=refresh))
                 
-                # Rate limiting
-                time.sleep(delay)
+                tasks = {
+                    indicator_name: [series_tasks[series_id] for series_id in series_ids]
+                    for indicator_name, series_ids in indicator_series.items()
+                }
+                results = {
+                    indicator_name: await asyncio.gather(*indicator_tasks)
+                    for indicator_name, indicator_tasks in tasks.items()
+                }
+        
+        for indicator_name, frames in results.items():
+            indicator_data = [df for df in frames if df is not None]
             
             if indicator_data:
                 # Combine data from multiple series if needed
+                # Series results are shared by every indicator using them; concat
+                # already builds new frames, so only a lone series needs copying
                 if len(indicator_data) == 1:
-                    combined_df = indicator_data[0]
+                    combined_df = indicator_data[0].copy()
                 else:
                     combined_df = pd.concat(indicator_data, ignore_index=True)
+                    combined_df.attrs['fetched_at'] = self._latest_fetched_at(indicator_data)
                 
                 all_data[indicator_name] = combined_df
                 
                 # Save individual file
-                clean_filename = re.sub(r'[^\w\-_]', '_', indicator_name.lower())
+                clean_filename = _RE_SANITIZE.sub('_', indicator_name.lower())
                 self.save_data(combined_df, clean_filename, format)
                 
             else:
@@ -282,20 +1017,19 @@ class FREDDataFetcher:
         # Save combined dataset
         if all_data:
             logger.info("Creating combined dataset")
-            combined_data = []
-            for indicator, df in all_data.items():
-                df_copy = df.copy()
-                df_copy['indicator'] = indicator
-                combined_data.append(df_copy)
-            
-            if combined_data:
-                master_df = pd.concat(combined_data, ignore_index=True)
-                self.save_data(master_df, "all_economic_indicators", format)
+            if format == "csv":
+                logger.warning("Saving the combined dataset as CSV is deprecated; "
+                               "use 'parquet' instead")
+            # Let concat stamp the indicator label through its keys instead of
+            # copying every frame to add the column
+            master_df = pd.concat(all_data, names=['indicator', None]).reset_index('indicator')
+            master_df.attrs['fetched_at'] = self._latest_fetched_at(all_data.values())
+            self.save_data(master_df, "all_economic_indicators", format)
         
         logger.info(f"Data fetching completed. Processed {len(all_data)} indicators.")
         return all_data
     
-    def update_data(self, days_back: int = 30, format: str = "csv"):
+    def update_data(self, days_back: int = 30, format: str = "parquet"):
         """
         Update existing data with recent observations
         
@@ -322,8 +1056,8 @@ def main():
     data = fetcher.fetch_all_indicators(
         bruno_dir="api/Economic Data",
         start_date="1990-01-01",  # Adjust as needed
-        format="csv",  # Can be 'csv', 'json', or 'parquet'
-        delay=0.5  # Delay between API calls
+        format="parquet",  # Can be 'parquet', 'json', or 'csv'
+        max_concurrency=6  # Concurrent API requests
     )
     
     if data:
@@ -0,0 +1,118 @@
+import asyncio
+
+import orjson
+
+import fred_apis
+from fred_apis import FREDDataFetcher, _RateLimiter, _MAX_RETRIES
+
+
+PAYLOAD = orjson.dumps({
+    "count": 2,
+    "observations": [
+        {"date": "2020-01-01", "value": "1.5"},
+        {"date": "2020-04-01", "value": "2.5"},
+    ],
+})
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        assert self.status < 400
+
+    async def read(self):
+        return self._body
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None):
+        self.calls += 1
+        return self._responses.pop(0)
+
+
+def throttled(retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return FakeResponse(429, headers)
+
+
+def fetch(fetcher, session, limiter):
+    return asyncio.run(fetcher.fetch_series_data_async(
+        session, "GDP", "2020-01-01", "2020-12-31", rate_limiter=limiter))
+
+
+def test_retries_throttled_request_and_recovers_rate(tmp_path):
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    limiter = _RateLimiter()
+    session = FakeSession([throttled("0"), throttled("0"), FakeResponse(200, body=PAYLOAD)])
+
+    df = fetch(fetcher, session, limiter)
+
+    assert session.calls == 3
+    assert list(df["value"]) == [1.5, 2.5]
+    # Back-to-back 429s count as one event, and a success starts the recovery
+    assert limiter.max_rate / 2 < limiter.refill_rate < limiter.max_rate
+
+    limiter.record_success()
+    assert limiter.refill_rate == limiter.max_rate
+
+
+def test_gives_up_without_waiting_after_last_attempt(tmp_path, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(fred_apis.asyncio, "sleep", fake_sleep)
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    session = FakeSession([throttled() for _ in range(_MAX_RETRIES + 1)])
+
+    assert fetch(fetcher, session, _RateLimiter()) is None
+    assert session.calls == _MAX_RETRIES + 1
+    assert delays == [2 ** attempt for attempt in range(_MAX_RETRIES)]
+
+
+def test_retries_server_errors_without_slowing_down(tmp_path, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(fred_apis.asyncio, "sleep", fake_sleep)
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    limiter = _RateLimiter()
+    session = FakeSession([FakeResponse(503), FakeResponse(502), FakeResponse(200, body=PAYLOAD)])
+
+    df = fetch(fetcher, session, limiter)
+
+    assert list(df["value"]) == [1.5, 2.5]
+    assert delays == [1, 2]
+    assert limiter.refill_rate == limiter.max_rate
+
+
+def test_throttle_keeps_tokens_and_respects_floor():
+    limiter = _RateLimiter(refill_rate=2, capacity=10)
+
+    for _ in range(10):
+        limiter._last_decrease = float("-inf")
+        limiter.record_throttle()
+
+    assert limiter.tokens >= 9
+    assert limiter.refill_rate == limiter.min_rate == 0.5
+
+    for _ in range(3):
+        limiter.record_success()
+    assert limiter.refill_rate == limiter.max_rate
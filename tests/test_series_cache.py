@@ -0,0 +1,130 @@
+import orjson
+import requests
+
+from fred_apis import FREDDataFetcher
+
+
+def payload(*observations):
+    return orjson.dumps({
+        "count": len(observations),
+        "observations": [{"date": date, "value": value} for date, value in observations],
+    })
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, *contents):
+        self._contents = list(contents)
+        self.params = []
+
+    def get(self, url, params=None, headers=None):
+        self.params.append(params)
+        content = self._contents.pop(0)
+        if content is None:
+            raise requests.exceptions.ConnectionError("connection refused")
+        return FakeResponse(content)
+
+    def close(self):
+        pass
+
+
+def seed(fetcher, start_date, *observations):
+    fresh = fetcher._parse_observations(payload(*observations), "GDP")
+    return fetcher._update_cached_series("GDP", None, fresh, (start_date, "2020-12-31"))
+
+
+def dates(df):
+    return [str(date) for date in df['date']]
+
+
+def test_later_start_is_sliced_from_the_same_cache_file(tmp_path):
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    seed(fetcher, "2020-01-01", ("2020-01-01", "1"), ("2020-04-01", "2"), ("2020-07-01", "3"))
+
+    cached, fetch_range = fetcher._load_cached_series("GDP", "2020-03-01", "2020-06-30")
+
+    assert fetch_range is None
+    assert dates(fetcher._slice_series(cached, "2020-03-01", "2020-06-30")) == ["2020-04-01"]
+    assert list(fetcher.cache_dir.glob("*.parquet")) == [fetcher._series_cache_path("GDP")]
+
+
+def test_forward_fetch_replaces_the_revision_window(tmp_path):
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path), revision_window_days=100)
+    seed(fetcher, "2020-01-01", ("2020-01-01", "1"), ("2020-04-01", "2"), ("2020-07-01", "3"),
+         ("2020-10-01", "4"))
+
+    cached, fetch_range = fetcher._load_cached_series("GDP", "2020-06-01", "2021-06-30")
+    assert fetch_range == ("2020-06-23", "2021-06-30")
+
+    fresh = fetcher._parse_observations(
+        payload(("2020-07-01", "3.5"), ("2020-10-01", "4.5"), ("2021-01-01", "5")), "GDP")
+    df = fetcher._update_cached_series("GDP", cached, fresh, fetch_range)
+
+    assert dates(df) == ["2020-01-01", "2020-04-01", "2020-07-01", "2020-10-01", "2021-01-01"]
+    assert list(df['value']) == [1.0, 2.0, 3.5, 4.5, 5.0]
+    assert df.attrs['cache_start'] == "2020-01-01"
+
+
+def test_earlier_start_extends_the_cache_backwards(tmp_path):
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    seed(fetcher, "2020-01-01", ("2020-01-01", "1"), ("2020-04-01", "2"))
+
+    cached, fetch_range = fetcher._load_cached_series("GDP", "2019-07-01", "2019-12-31")
+    assert fetch_range == ("2019-07-01", "2020-01-01")
+
+    fresh = fetcher._parse_observations(
+        payload(("2019-07-01", "0.5"), ("2019-10-01", "0.8"), ("2020-01-01", "1")), "GDP")
+    fetcher._update_cached_series("GDP", cached, fresh, fetch_range)
+
+    cached, fetch_range = fetcher._load_cached_series("GDP", "2019-07-01", "2020-03-31")
+    assert fetch_range is None
+    assert cached.attrs['cache_start'] == "2019-07-01"
+    assert dates(cached) == ["2019-07-01", "2019-10-01", "2020-01-01", "2020-04-01"]
+
+
+def test_refresh_refetches_the_whole_range(tmp_path):
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    seed(fetcher, "2020-01-01", ("2020-01-01", "1"), ("2020-04-01", "2"))
+    fetcher._session = FakeSession(payload(("2020-01-01", "1.1"), ("2020-04-01", "2.2")))
+
+    df = fetcher.fetch_series_data("GDP", "2020-01-01", "2020-06-30", refresh=True)
+
+    assert fetcher._session.params[0]['observation_start'] == "2020-01-01"
+    assert list(df['value']) == [1.1, 2.2]
+    assert 'cache_start' not in df.attrs
+
+
+def test_empty_response_keeps_the_cached_series(tmp_path):
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    seed(fetcher, "2020-01-01", ("2020-01-01", "1"), ("2020-04-01", "2"))
+    cached, fetch_range = fetcher._load_cached_series("GDP", "2020-01-01", "2021-03-31")
+
+    df = fetcher._process_response(payload(), "GDP", "2020-01-01", "2021-03-31", cached,
+                                   fetch_range)
+
+    assert dates(df) == ["2020-01-01", "2020-04-01"]
+    cached, _ = fetcher._load_cached_series("GDP", "2020-01-01", "2020-12-31")
+    assert dates(cached) == ["2020-01-01", "2020-04-01"]
+
+
+def test_stale_fallback_is_not_memoized(tmp_path):
+    fetcher = FREDDataFetcher(api_key="test", data_dir=str(tmp_path))
+    seed(fetcher, "2020-01-01", ("2020-01-01", "1"), ("2020-04-01", "2"))
+    fetcher._session = FakeSession(
+        None, payload(("2020-01-01", "1"), ("2020-04-01", "2"), ("2020-07-01", "3")))
+
+    stale = fetcher.fetch_series_data("GDP", "2020-01-01", "2021-03-31")
+    assert dates(stale) == ["2020-01-01", "2020-04-01"]
+    assert not fetcher._series_cache
+
+    df = fetcher.fetch_series_data("GDP", "2020-01-01", "2021-03-31")
+    assert dates(df) == ["2020-01-01", "2020-04-01", "2020-07-01"]
+    assert len(fetcher._session.params) == 2